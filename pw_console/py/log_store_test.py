@@ -59,6 +59,72 @@ class TestLogStore(unittest.TestCase):
         log_store.clear_logs()
         self.assertEqual(0, log_store.get_total_count())
 
+    def test_emit_preformatted(self) -> None:
+        """Test preformatted logs are stored without running the formatter."""
+        log_store, viewer = _create_log_store()
+        log_store.format = MagicMock()  # type: ignore
+
+        record = logging.makeLogRecord(
+            dict(name='log_store.test',
+                 levelno=logging.INFO,
+                 levelname='INFO',
+                 msg='Test log %s',
+                 args=(1, )))
+        log_store.emit_preformatted(record,
+                                    '\x1b[30;47mTIME\x1b[0m INFO Test log 1')
+
+        log_store.format.assert_not_called()
+        viewer.new_logs_arrived.assert_called()
+        self.assertEqual(1, log_store.get_total_count())
+        self.assertEqual('TIME INFO Test log 1',
+                         log_store.logs[0].ansi_stripped_log)
+        self.assertEqual('Test log 1', log_store.logs[0].record.message)
+        self.assertEqual({'log_store.test': 1}, log_store.channel_counts)
+
+    def test_max_history_size(self) -> None:
+        """Test the oldest logs are dropped once the history is full."""
+        log_store, _viewer = _create_log_store()
+        log_store.max_history_size = 3
+
+        test_log = logging.getLogger('log_store.test')
+        with self.assertLogs(test_log, level='DEBUG') as _log_context:
+            test_log.addHandler(log_store)
+            for i in range(5):
+                test_log.debug('Test log %s', i)
+
+        self.assertEqual(3, log_store.get_total_count())
+        self.assertEqual(2, log_store.evicted_log_count)
+        self.assertEqual(
+            ['Test log 2', 'Test log 3', 'Test log 4'],
+            [log.record.getMessage() for log in log_store.logs],
+        )
+        self.assertEqual('Test log 2', log_store.logs[0].record.getMessage())
+        self.assertEqual('Test log 4', log_store.logs[-1].record.getMessage())
+        self.assertEqual(
+            ['Test log 3', 'Test log 4'],
+            [log.record.getMessage() for log in log_store.logs[1:]],
+        )
+        with self.assertRaises(IndexError):
+            _ = log_store.logs[3]
+        with self.assertRaises(IndexError):
+            _ = log_store.logs[-4]
+
+        # Shrinking the history drops the oldest logs when the next log
+        # arrives.
+        log_store.max_history_size = 2
+        with self.assertLogs(test_log, level='DEBUG') as _log_context:
+            test_log.addHandler(log_store)
+            test_log.debug('Test log 5')
+        self.assertEqual(4, log_store.evicted_log_count)
+        self.assertEqual(
+            ['Test log 4', 'Test log 5'],
+            [log.record.getMessage() for log in log_store.logs],
+        )
+
+        log_store.clear_logs()
+        self.assertEqual(0, log_store.get_total_count())
+        self.assertEqual(0, log_store.evicted_log_count)
+
     def test_channel_counts_and_prefix_width(self) -> None:
         """Test logger names and prefix width calculations."""
         log_store, _viewer = _create_log_store()
@@ -72,6 +72,136 @@ class TestLogView(unittest.TestCase):
 
         return log_view, log_pane
 
+    def test_log_indexes_follow_evicted_logs(self) -> None:
+        """Test saved log indexes still point to the same logs after the log
+        store drops old logs."""
+        log_view, _log_pane = _create_log_view()
+        log_view.log_store.max_history_size = 10
+        test_log = logging.getLogger('log_view.test')
+        with self.assertLogs(test_log, level='DEBUG') as _log_context:
+            test_log.addHandler(log_view.log_store)
+            for i in range(10):
+                test_log.debug('Test log %s', i)
+
+        log_view.log_index = 5
+        log_view.save_search_matched_line(2)
+        log_view.save_search_matched_line(7)
+        log_view.last_search_matched_log = 7
+        log_view.marked_logs_start = 1
+        log_view.marked_logs_end = 6
+        log_view._last_served_websocket_index = 9  # pylint: disable=protected-access
+        log_view._hidden_log_count = 5  # pylint: disable=protected-access
+
+        with self.assertLogs(test_log, level='DEBUG') as _log_context:
+            test_log.addHandler(log_view.log_store)
+            for i in range(10, 13):
+                test_log.debug('Test log %s', i)
+
+        logs = log_view.log_store.logs
+        self.assertEqual(10, len(logs))
+
+        def message(log_index: int) -> str:
+            return logs[log_index].record.getMessage()
+
+        self.assertEqual('Test log 5', message(log_view.log_index))
+        # The match for 'Test log 2' was evicted.
+        self.assertEqual({4: 0}, log_view.search_matched_lines)
+        self.assertEqual('Test log 7',
+                         message(log_view.last_search_matched_log))
+        self.assertEqual(('Test log 3', 'Test log 6'),
+                         (message(log_view.marked_logs_start),
+                          message(log_view.marked_logs_end)))
+        # The 3 new logs are still waiting to be sent.
+        self.assertEqual(
+            range(7, 10),
+            range(
+                log_view._last_served_websocket_index + 1,  # pylint: disable=protected-access
+                log_view.get_total_count()))
+        self.assertEqual('Test log 5', message(log_view.hidden_line_count()))
+
+    def test_evicted_logs_keep_screen_in_place(self) -> None:
+        """Test the log screen does not jump when logs above it are evicted."""
+        log_view, log_pane = _create_log_view()
+        log_pane.get_horizontal_scroll_amount = MagicMock(return_value=0)
+        log_view.log_store.max_history_size = 50
+        test_log = logging.getLogger('log_view.test')
+        with self.assertLogs(test_log, level='DEBUG') as _log_context:
+            test_log.addHandler(log_view.log_store)
+            for i in range(50):
+                test_log.debug('Test log %s', i)
+
+        log_view.render_content()
+        log_pane.pane_resized = MagicMock(return_value=False)
+        log_view.scroll(-15)
+        log_view.render_content()
+        log_screen = log_view.log_screen
+        self.assertFalse(log_view.follow)
+        cursor_position = log_screen.cursor_position
+        selected_log = log_view.log_store.logs[log_view.log_index]
+
+        def screen_logs():
+            return [
+                log_view.log_store.logs[line.log_index]
+                for line in log_screen.line_buffer
+            ]
+
+        visible_logs = screen_logs()
+
+        with self.assertLogs(test_log, level='DEBUG') as _log_context:
+            test_log.addHandler(log_view.log_store)
+            test_log.debug('Test log 50')
+        log_view.render_content()
+
+        self.assertEqual(1, log_view.log_store.evicted_log_count)
+        self.assertEqual(cursor_position, log_screen.cursor_position)
+        self.assertIs(selected_log,
+                      log_view.log_store.logs[log_view.log_index])
+        self.assertEqual(visible_logs, screen_logs())
+
+        # Filtered log indexes are not affected by evictions so the screen is
+        # left as is.
+        log_view.filtering_on = True
+        log_view._reset_log_screen_on_next_render = False  # pylint: disable=protected-access
+        with self.assertLogs(test_log, level='DEBUG') as _log_context:
+            test_log.addHandler(log_view.log_store)
+            test_log.debug('Test log 51')
+        self.assertFalse(log_view._reset_log_screen_on_next_render)  # pylint: disable=protected-access
+
+        # New views start from the current eviction count.
+        new_log_view = LogView(log_pane,
+                               log_pane.application,
+                               log_store=log_view.log_store)
+        self.assertEqual(
+            2,
+            new_log_view._last_log_store_evicted_count)  # pylint: disable=protected-access
+
+    def test_evicted_logs_keep_scrollback_hidden(self) -> None:
+        """Test hidden logs stay hidden when older logs are evicted."""
+        log_view, _log_pane = _create_log_view()
+        log_view.log_store.max_history_size = 10
+        test_log = logging.getLogger('log_view.test')
+        with self.assertLogs(test_log, level='DEBUG') as _log_context:
+            test_log.addHandler(log_view.log_store)
+            for i in range(10):
+                test_log.debug('Test log %s', i)
+
+        # Hide logs 0 through 4.
+        log_view.log_index = 4
+        log_view.clear_scrollback()
+        self.assertEqual(5, log_view.hidden_line_count())
+
+        with self.assertLogs(test_log, level='DEBUG') as _log_context:
+            test_log.addHandler(log_view.log_store)
+            for i in range(10, 14):
+                test_log.debug('Test log %s', i)
+
+        # Only 'Test log 4' is still hidden.
+        self.assertEqual(1, log_view.hidden_line_count())
+        self.assertEqual(
+            'Test log 5',
+            log_view.log_store.logs[
+                log_view.hidden_line_count()].record.getMessage())
+
     def test_follow_toggle(self) -> None:
         log_view, _pane = _create_log_view()
         self.assertTrue(log_view.follow)
@@ -247,6 +377,108 @@ class TestLogView(unittest.TestCase):
 
         self.assertEqual(result_text, expected_formatted_text)
 
+    def test_render_content_reuses_layout_cache(self) -> None:
+        """Test log screen layouts are cached until the window is resized."""
+        log_view, log_pane = self._create_log_view_with_logs(log_count=4)
+        log_pane.get_horizontal_scroll_amount = MagicMock(return_value=0)
+
+        log_view.render_content()
+        last_log = log_view.log_store.logs[-1]
+        self.assertIsNotNone(last_log.layout_cache)
+        cached_lines = last_log.layout_cache[1]
+
+        # Redrawing the screen at the same size reuses the cached lines.
+        log_view.scroll_to_bottom()
+        log_view.render_content()
+        self.assertIs(cached_lines, last_log.layout_cache[1])
+
+        # Resizing the window creates a new layout.
+        log_pane.current_log_pane_width = 40
+        log_view.render_content()
+        self.assertIsNot(cached_lines, last_log.layout_cache[1])
+        self.assertEqual(40, last_log.layout_cache[0][0])
+
+    def test_render_content_follow_mode_reuses_lines(self) -> None:
+        """Test follow mode only re-renders lines if something changed."""
+        log_view, log_pane = self._create_log_view_with_logs(log_count=4)
+        log_pane.get_horizontal_scroll_amount = MagicMock(return_value=0)
+        self.assertTrue(log_view.follow)
+
+        lines = log_view.render_content()
+        log_pane.pane_resized = MagicMock(return_value=False)
+        self.assertIs(lines, log_view.render_content())
+
+        # A new log arriving in follow mode triggers a re-render.
+        test_log = logging.getLogger('log_view.test')
+        with self.assertLogs(test_log, level='DEBUG') as _log_context:
+            test_log.addHandler(log_view.log_store)
+            test_log.debug('Test log')
+        self.assertIsNot(lines, log_view.render_content())
+
+    def test_get_lines_reuses_selected_line(self) -> None:
+        """Test the highlighted line is only re-styled if the cursor moves."""
+        log_view, log_pane = self._create_log_view_with_logs(log_count=4)
+        log_pane.get_horizontal_scroll_amount = MagicMock(return_value=0)
+        log_view.render_content()
+        log_screen = log_view.log_screen
+
+        selected_line = log_screen.get_lines()[log_screen.cursor_position]
+        self.assertIs(selected_line,
+                      log_screen.get_lines()[log_screen.cursor_position])
+
+        # Moving the cursor styles a different line.
+        log_screen.move_cursor_up(-1)
+        self.assertIsNot(selected_line,
+                         log_screen.get_lines()[log_screen.cursor_position])
+
+        # Resizing drops the saved line.
+        log_screen.move_cursor_down(1)
+        selected_line = log_screen.get_lines()[log_screen.cursor_position]
+        log_screen.resize(log_screen.width + 10, log_screen.height)
+        self.assertIsNot(selected_line,
+                         log_screen.get_lines()[log_screen.cursor_position])
+
+    def test_reset_logs_with_wrapped_lines(self) -> None:
+        """Test only logs visible on screen are fetched when lines wrap."""
+        log_view, log_pane = self._create_log_view_with_logs(log_count=20)
+        log_pane.get_horizontal_scroll_amount = MagicMock(return_value=0)
+        log_pane.wrap_lines = True
+        log_pane.current_log_pane_width = 20
+        log_pane.current_log_pane_height = 10
+
+        log_view.render_content()
+        log_screen = log_view.log_screen
+
+        # Each log wraps onto 2 lines so only the last 5 logs are visible.
+        self.assertEqual(10, len(log_screen.line_buffer))
+        self.assertEqual(15, log_screen.first_rendered_log_index())
+        self.assertEqual(19, log_screen.last_rendered_log_index())
+        self.assertEqual(2, log_screen.line_buffer[-1].height)
+        # Logs above the screen were never formatted.
+        self.assertIsNone(log_view.log_store.logs[14].layout_cache)
+
+        # Each visible log is formatted once per reset, even when search
+        # highlighting skips the layout cache.
+        self.assertTrue(log_view.new_search('Test log', interactive=False))
+        log_view.search_highlight = True
+        assert log_view.search_filter is not None
+        highlight_search_matches = MagicMock(
+            wraps=log_view.search_filter.highlight_search_matches)
+        log_view.search_filter.highlight_search_matches = (
+            highlight_search_matches)
+        # pylint: disable=protected-access
+        get_fragments_per_line = MagicMock(
+            wraps=log_screen._get_fragments_per_line)
+        log_screen._get_fragments_per_line = get_fragments_per_line
+        # pylint: enable=protected-access
+        log_screen.reset_logs(log_index=19)
+        self.assertEqual(
+            list(range(19, 14, -1)),
+            [call.args[0] for call in get_fragments_per_line.call_args_list])
+        self.assertEqual(5, highlight_search_matches.call_count)
+        self.assertEqual(15, log_screen.first_rendered_log_index())
+        self.assertEqual(19, log_screen.last_rendered_log_index())
+
     def test_clear_scrollback(self) -> None:
         """Test various functions with clearing log scrollback history."""
         # pylint: disable=protected-access
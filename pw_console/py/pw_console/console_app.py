@@ -150,7 +150,9 @@ class ConsoleApp:
         # Max frequency in seconds of prompt_toolkit UI redraws triggered by new
         # log lines.
         self.log_ui_update_frequency = 0.1  # 10 FPS
-        self._last_ui_update_time = time.time()
+        # Monotonic clock time of the last redraw. Unaffected by system clock
+        # changes.
+        self._last_ui_update_time = time.monotonic()
 
         self.http_server: Optional[socketserver.TCPServer] = None
         self.html_files: Dict[str, str] = {}
@@ -980,7 +982,7 @@ class ConsoleApp:
         self.application.exit()
 
     def logs_redraw(self):
-        emit_time = time.time()
+        emit_time = time.monotonic()
         # Has enough time passed since last UI redraw due to new logs?
         if emit_time > self._last_ui_update_time + self.log_ui_update_frequency:
             # Update last log time
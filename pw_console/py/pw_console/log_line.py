@@ -16,12 +16,14 @@
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Hashable, List, Optional, Tuple
 
 from prompt_toolkit.formatted_text import ANSI, StyleAndTextTuples
 
 from pw_log_tokenized import FormatStringWithMetadata
 
+from pw_console.text_formatting import strip_ansi
+
 
 @dataclass
 class LogLine:
@@ -33,6 +35,11 @@ class LogLine:
     def __post_init__(self):
         self.metadata = None
         self.fragment_cache = None
+        self._ansi_stripped_message: Optional[str] = None
+        # Screen lines for this log saved by LogScreen along with the layout
+        # key (screen width, wrapping and formatter state) used to create them.
+        self.layout_cache: Optional[Tuple[Hashable,
+                                          List[StyleAndTextTuples]]] = None
 
     def time(self):
         """Return a datetime object for the log record."""
@@ -80,6 +87,15 @@ class LogLine:
 
         return self.metadata
 
+    def ansi_stripped_message(self) -> str:
+        """Return the log record message with ANSI escape sequences removed.
+
+        The result is cached since the record message doesn't change once
+        formatted."""
+        if self._ansi_stripped_message is None:
+            self._ansi_stripped_message = strip_ansi(self.record.message)
+        return self._ansi_stripped_message
+
     def get_fragments(self) -> StyleAndTextTuples:
         """Return this log line as a list of FormattedText tuples."""
         # Parse metadata if any.
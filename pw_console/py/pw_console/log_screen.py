@@ -17,7 +17,15 @@ from __future__ import annotations
 import collections
 import dataclasses
 import logging
-from typing import Callable, List, Optional, Tuple, TYPE_CHECKING
+from typing import (
+    Callable,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 from prompt_toolkit.formatted_text import (
     to_formatted_text,
@@ -37,6 +45,9 @@ if TYPE_CHECKING:
 
 _LOG = logging.getLogger(__package__)
 
+# Max number of LogLines that keep a cached screen layout.
+_LAYOUT_CACHE_SIZE = 1000
+
 
 @dataclasses.dataclass
 class ScreenLine:
@@ -88,7 +99,7 @@ class ScreenLine:
     fragments: StyleAndTextTuples
 
     # Log index reference for this screen line. This is the index to where the
-    # log message resides in the parent LogStore.logs deque. It is set to None
+    # log message resides in the parent LogStore.logs. It is set to None
     # if this is an empty ScreenLine. If a log message requires line wrapping
     # then each resulting ScreenLine instance will have the same log_index
     # value.
@@ -126,12 +137,14 @@ class LogScreen:
     It is responsible for moving the cursor_position, prepending and appending
     log lines as the user moves the cursor."""
     # Callable functions to retrieve logs and display formatting.
-    get_log_source: Callable[[], Tuple[int, collections.deque[LogLine]]]
+    get_log_source: Callable[[], Tuple[int, Sequence[LogLine]]]
     get_line_wrapping: Callable[[], bool]
     get_log_formatter: Callable[[], Optional[Callable[[LogLine],
                                                       StyleAndTextTuples]]]
     get_search_filter: Callable[[], Optional[LogFilter]]
     get_search_highlight: Callable[[], bool]
+    # Returns a key that changes whenever the log formatter output would.
+    get_formatter_layout_key: Callable[[], Hashable] = lambda: None
 
     # Window row of the current cursor position
     cursor_position: int = 0
@@ -152,6 +165,28 @@ class LogScreen:
         # Save the last log index when appending. Useful for tracking how many
         # new lines need appending in follow mode.
         self.last_appended_log_index: int = 0
+        # LogLines with a saved layout_cache, oldest first. Caches are dropped
+        # from the oldest LogLines to bound memory use.
+        self._layout_cached_logs: collections.deque[LogLine] = (
+            collections.deque())
+        # Styled fragments of the line under the cursor from the last
+        # get_lines() call. Saved as (source fragments, width, styled
+        # fragments) and reused while the cursor stays on the same line.
+        self._selected_line_cache: Optional[Tuple[StyleAndTextTuples, int,
+                                                  StyleAndTextTuples]] = None
+
+    def _save_layout_cache(
+        self,
+        log: LogLine,
+        layout_key: Hashable,
+        fragments_per_line: List[StyleAndTextTuples],
+    ) -> None:
+        """Save the screen lines for a log message."""
+        if log.layout_cache is None:
+            if len(self._layout_cached_logs) >= _LAYOUT_CACHE_SIZE:
+                self._layout_cached_logs.popleft().layout_cache = None
+            self._layout_cached_logs.append(log)
+        log.layout_cache = (layout_key, fragments_per_line)
 
     def _fill_top_with_empty_lines(self) -> None:
         """Add empty lines to fill the remaining empty screen space."""
@@ -163,6 +198,7 @@ class LogScreen:
         self.line_buffer.clear()
         self._fill_top_with_empty_lines()
         self._empty = True
+        self._selected_line_cache = None
 
     def empty(self) -> bool:
         """Return True if the screen has no lines with content."""
@@ -183,28 +219,56 @@ class LogScreen:
         # number of available logs is less, use that amount.
         max_log_messages_to_fetch = min(self.height, len(log_source))
 
-        # Including the target log_index, fetch the desired logs.
+        # Including the target log_index, find the first log to display.
         # For example if we are rendering log_index 10 and the window height is
-        # 6 the range below will be:
-        # >>> list(i for i in range((10 - 6) + 1, 10 + 1))
-        # [5, 6, 7, 8, 9, 10]
-        for i in range((log_index - max_log_messages_to_fetch) + 1,
-                       log_index + 1):
-            # If i is < 0 it's an invalid log, skip to the next line. The next
-            # index could be 0 or higher since we are traversing in increasing
-            # order.
-            if i < start_log_index:
-                continue
-            self.append_log(i)
+        # 6 the first log index will be at most:
+        # >>> (10 - 6) + 1
+        # 5
+        # Skip any invalid logs before start_log_index.
+        earliest_log_index = max(start_log_index,
+                                 (log_index - max_log_messages_to_fetch) + 1)
+
+        # Wrapped log messages take up more than one line. Walk backwards from
+        # log_index and stop once the screen is full so logs that would be
+        # trimmed off the top are never fetched. The lines are kept so each log
+        # is only formatted once.
+        visible_logs: List[Tuple[int, List[StyleAndTextTuples]]] = []
+        used_height = 0
+        for i in range(log_index, earliest_log_index - 1, -1):
+            fragments_per_line = self._get_fragments_per_line(i)
+            visible_logs.append((i, fragments_per_line))
+            used_height += len(fragments_per_line)
+            if used_height >= self.height:
+                break
+
+        for i, fragments_per_line in reversed(visible_logs):
+            self._append_log_lines(i, fragments_per_line)
         # Make sure the bottom line is highlighted.
         self.move_cursor_to_bottom()
 
+    def shift_log_indexes(self, evicted_count: int) -> bool:
+        """Move log indexes down after logs are dropped from the log source.
+
+        Returns False without changing anything if a log on screen was dropped.
+        In that case the caller should run reset_logs()."""
+        for line in self.line_buffer:
+            if line.log_index is not None and line.log_index < evicted_count:
+                return False
+
+        for line in self.line_buffer:
+            if line.log_index is not None:
+                line.log_index -= evicted_count
+        self.last_appended_log_index = max(
+            0, self.last_appended_log_index - evicted_count)
+        return True
+
     def resize(self, width, height) -> None:
         """Update screen width and height.
 
         Following a resize the caller should run reset_logs()."""
         self.width = width
         self.height = height
+        self._selected_line_cache = None
 
     def get_lines(
         self,
@@ -228,19 +292,7 @@ class LogScreen:
             if (i == self.cursor_position
                     and (self.cursor_position < len(self.line_buffer))
                     and not self.line_buffer[self.cursor_position].empty()):
-                # Fill in empty charaters to the width of the screen. This
-                # ensures the backgound is highlighted to the edge of the
-                # screen.
-                new_fragments = fill_character_width(
-                    line.fragments,
-                    len(line.fragments) - 1,  # -1 for the ending line break
-                    self.width,
-                )
-
-                # Apply a style to highlight this line.
-                all_lines.append(
-                    to_formatted_text(new_fragments,
-                                      style='class:selected-log-line'))
+                all_lines.append(self._get_selected_line_fragments(line))
             elif line.log_index is not None and (
                     marked_logs_start <= line.log_index <= marked_logs_end):
                 new_fragments = fill_character_width(
@@ -259,6 +311,33 @@ class LogScreen:
 
         return all_lines
 
+    def _get_selected_line_fragments(
+            self, line: ScreenLine) -> StyleAndTextTuples:
+        """Return fragments for the line under the cursor with highlighting.
+
+        The result is reused until the cursor moves to a different ScreenLine
+        or the screen width changes."""
+        if self._selected_line_cache is not None:
+            source_fragments, width, styled_fragments = (
+                self._selected_line_cache)
+            if source_fragments is line.fragments and width == self.width:
+                return styled_fragments
+
+        # Fill in empty charaters to the width of the screen. This ensures the
+        # backgound is highlighted to the edge of the screen.
+        new_fragments = fill_character_width(
+            line.fragments,
+            len(line.fragments) - 1,  # -1 for the ending line break
+            self.width,
+        )
+
+        # Apply a style to highlight this line.
+        styled_fragments = to_formatted_text(new_fragments,
+                                             style='class:selected-log-line')
+        self._selected_line_cache = (line.fragments, self.width,
+                                     styled_fragments)
+        return styled_fragments
+
     def _prepend_line(self, line: ScreenLine) -> None:
         """Add a line to the top of the screen."""
         self.line_buffer.appendleft(line)
@@ -560,6 +639,17 @@ class LogScreen:
         search_filter = self.get_search_filter()
         search_highlight = self.get_search_highlight()
 
+        highlight_matches = bool(search_filter and search_highlight
+                                 and search_filter.matches(log))
+
+        # Reuse the last layout if nothing affecting it has changed. Search
+        # highlighted lines are not cached.
+        layout_key = (self.width, truncate_lines, table_formatter is not None,
+                      self.get_formatter_layout_key())
+        if (not highlight_matches and log.layout_cache is not None
+                and log.layout_cache[0] == layout_key):
+            return log.layout_cache[1]
+
         # Select the log display formatter; table or standard.
         fragments: StyleAndTextTuples = []
         if table_formatter:
@@ -568,7 +658,8 @@ class LogScreen:
             fragments = log.get_fragments()
 
         # Apply search term highlighting.
-        if search_filter and search_highlight and search_filter.matches(log):
+        if highlight_matches:
+            assert search_filter is not None
             fragments = search_filter.highlight_search_matches(fragments)
 
         # Word wrap the log message or truncate to screen width
@@ -579,6 +670,9 @@ class LogScreen:
         # Convert the existing flattened fragments to a list of lines.
         fragments_per_line = split_lines(line_fragments)
 
+        if not highlight_matches:
+            self._save_layout_cache(log, layout_key, fragments_per_line)
+
         return fragments_per_line
 
     def prepend_log(
@@ -632,9 +726,19 @@ class LogScreen:
         subline: Optional[int] = None,
     ) -> None:
         """Add a log message or a single line to the bottom of the screen."""
+        self._append_log_lines(log_index,
+                               self._get_fragments_per_line(log_index),
+                               subline)
+
+    def _append_log_lines(
+        self,
+        log_index: int,
+        fragments_per_line: List[StyleAndTextTuples],
+        subline: Optional[int] = None,
+    ) -> None:
+        """Add already formatted lines of a log to the bottom of the screen."""
         # Save this log_index
         self.last_appended_log_index = log_index
-        fragments_per_line = self._get_fragments_per_line(log_index)
 
         for line_index, line in enumerate(fragments_per_line):
             # If we are looking for a specific subline and this isn't it, skip.
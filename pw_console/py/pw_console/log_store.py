@@ -14,10 +14,11 @@
 """LogStore saves logs and acts as a Python logging handler."""
 
 from __future__ import annotations
-import collections
+import collections.abc
+import itertools
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, Iterator, List, Optional, TYPE_CHECKING
 
 import pw_cli.color
 
@@ -30,6 +31,72 @@ if TYPE_CHECKING:
     from pw_console.log_view import LogView
 
 
+class LogRingBuffer(collections.abc.Sequence):
+    """Bounded list of LogLines with constant time indexing.
+
+    Logs are kept in a plain list that grows up to history_size entries. Until
+    then the list is in log order and is indexed directly. Once full each
+    append overwrites the oldest log and the list is read as a ring starting
+    at the oldest log.
+    """
+    def __init__(self, history_size: int) -> None:
+        self.history_size = history_size
+        self._buf: List[LogLine] = []
+        # Position of the oldest log in self._buf.
+        self._head = 0
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def __getitem__(self, index):
+        head = self._head
+        if not head:
+            # Oldest log is first so list indexing and slicing apply as is.
+            return self._buf[index]
+        size = len(self._buf)
+        try:
+            # Offset into the list with a negative index so it wraps around to
+            # the front without a modulo.
+            if 0 <= index < size:
+                return self._buf[index + head - size]
+            if -size <= index < 0:
+                return self._buf[index + head]
+        except TypeError:
+            # Comparing a slice with an int raises TypeError.
+            return [self[i] for i in range(*index.indices(size))]
+        raise IndexError('LogRingBuffer index out of range')
+
+    def __iter__(self) -> Iterator[LogLine]:
+        if not self._head:
+            return iter(self._buf)
+        return itertools.chain(self._buf[self._head:], self._buf[:self._head])
+
+    def append(self, line: LogLine) -> Optional[LogLine]:
+        """Add a log to the end, returning the evicted log if full."""
+        if len(self._buf) < self.history_size:
+            self._buf.append(line)
+            return None
+
+        evicted = self._buf[self._head]
+        self._buf[self._head] = line
+        self._head = (self._head + 1) % len(self._buf)
+        return evicted
+
+    def resize(self, history_size: int) -> int:
+        """Change the max number of logs, returning how many were dropped."""
+        logs = list(self)
+        dropped_count = max(0, len(logs) - history_size)
+        self._buf = logs[dropped_count:]
+        self._head = 0
+        self.history_size = history_size
+        return dropped_count
+
+    def clear(self) -> None:
+        """Drop all stored logs."""
+        self._buf = []
+        self._head = 0
+
+
 class LogStore(logging.Handler):
     """Pigweed Console logging handler.
 
@@ -86,13 +153,18 @@ class LogStore(logging.Handler):
                                  project_user_file=False,
                                  user_file=False)
         self.prefs = prefs
-        # Log storage deque for fast addition and deletion from the beginning
-        # and end of the iterable.
-        self.logs: collections.deque = collections.deque()
 
-        # Only allow this many log lines in memory.
+        # Only allow this many log lines in memory. Changes take effect when
+        # the next log arrives.
         self.max_history_size: int = 1000000
 
+        # Log storage ring buffer for constant time indexing. The oldest logs
+        # are overwritten once max_history_size is reached.
+        self.logs: LogRingBuffer = LogRingBuffer(self.max_history_size)
+        # Number of logs dropped from the beginning of self.logs. Each eviction
+        # shifts the index of all remaining logs down by one.
+        self.evicted_log_count: int = 0
+
         # Counts of logs per python logger name
         self.channel_counts: Dict[str, int] = {}
         # Widths of each logger prefix string. For example: the character length
@@ -141,9 +213,12 @@ class LogStore(logging.Handler):
 
     def clear_logs(self):
         """Erase all stored pane lines."""
-        self.logs = collections.deque()
+        self.logs.clear()
+        self.logs.resize(self.max_history_size)
+        self.evicted_log_count = 0
         self.channel_counts = {}
         self.channel_formatted_prefix_widths = {}
+        self.longest_channel_prefix_width = 0
         self.line_index = 0
 
     def get_channel_counts(self):
@@ -182,13 +257,10 @@ class LogStore(logging.Handler):
                 formatted_time_and_level = format_without_message % dict(
                     asctime=record.asctime, levelname=record.levelname)
 
-                # Delete ANSI escape sequences.
-                ansi_stripped_time_and_level = (
-                    pw_console.text_formatting.strip_ansi(
+                # Width without ANSI escape sequences.
+                self.channel_formatted_prefix_widths[record.name] = (
+                    pw_console.text_formatting.ansi_stripped_length(
                         formatted_time_and_level))
-
-                self.channel_formatted_prefix_widths[record.name] = len(
-                    ansi_stripped_time_and_level)
             else:
                 self.channel_formatted_prefix_widths[record.name] = 0
 
@@ -196,17 +268,23 @@ class LogStore(logging.Handler):
             self.longest_channel_prefix_width = max(
                 self.channel_formatted_prefix_widths.values())
 
-    def _append_log(self, record: logging.LogRecord):
+    def _append_log(self,
+                    record: logging.LogRecord,
+                    formatted_log: Optional[str] = None):
         """Add a new log event."""
-        # Format incoming log line.
-        formatted_log = self.format(record)
+        # Format incoming log line if needed.
+        if formatted_log is None:
+            formatted_log = self.format(record)
         ansi_stripped_log = pw_console.text_formatting.strip_ansi(
             formatted_log)
+        line = LogLine(record=record,
+                       formatted_log=formatted_log,
+                       ansi_stripped_log=ansi_stripped_log)
         # Save this log.
-        self.logs.append(
-            LogLine(record=record,
-                    formatted_log=formatted_log,
-                    ansi_stripped_log=ansi_stripped_log))
+        if self.logs.history_size != self.max_history_size:
+            self.evicted_log_count += self.logs.resize(self.max_history_size)
+        if self.logs.append(line) is not None:
+            self.evicted_log_count += 1
         # Increment this logger count
         self.channel_counts[record.name] = self.channel_counts.get(
             record.name, 0) + 1
@@ -217,10 +295,10 @@ class LogStore(logging.Handler):
         self.channel_formatted_prefix_widths[record.name] = 0
 
         # Parse metadata fields
-        self.logs[-1].update_metadata()
+        line.update_metadata()
 
         # Check for bigger column widths.
-        self.table.update_metadata_column_widths(self.logs[-1])
+        self.table.update_metadata_column_widths(line)
 
     def emit(self, record) -> None:
         """Process a new log record.
@@ -230,7 +308,37 @@ class LogStore(logging.Handler):
         the parent class with thread safety and filters applied.
         """
         self._append_log(record)
-        # Notify viewers of new logs
+        self._notify_viewers()
+
+    def emit_preformatted(self, record: logging.LogRecord,
+                          formatted_log: str) -> None:
+        """Store a log record with text that has already been formatted.
+
+        This skips running the logging.Formatter on the record which is the
+        most expensive part of emit(). Use this when the final log text is
+        already available, for example when relaying logs from another
+        process. Handler filters and locking are applied the same as
+        logging.Handler.handle().
+
+        Args:
+            record: The log record to store.
+            formatted_log: The display text for this record. This may
+                contain ANSI escape sequences.
+        """
+        if not self.filter(record):
+            return
+        # Fields normally set by logging.Formatter.format().
+        if not hasattr(record, 'message'):
+            record.message = record.getMessage()
+        self.acquire()
+        try:
+            self._append_log(record, formatted_log)
+            self._notify_viewers()
+        finally:
+            self.release()
+
+    def _notify_viewers(self) -> None:
+        """Notify viewers of new logs."""
         for viewer in self.registered_viewers:
             viewer.new_logs_arrived()
 
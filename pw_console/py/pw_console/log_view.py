@@ -25,7 +25,15 @@ import operator
 from pathlib import Path
 import re
 from threading import Thread
-from typing import Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 from prompt_toolkit.data_structures import Point
 from prompt_toolkit.formatted_text import StyleAndTextTuples
@@ -106,6 +114,7 @@ class LogView:
             get_log_formatter=self._get_table_formatter,
             get_search_filter=lambda: self.search_filter,
             get_search_highlight=lambda: self.search_highlight,
+            get_formatter_layout_key=self._get_formatter_layout_key,
         )
 
         # Filter
@@ -123,7 +132,8 @@ class LogView:
         self._last_end_index = 0
         self._current_start_index = 0
         self._current_end_index = 0
-        self._scrollback_start_index = 0
+        # Number of logs hidden from the top by clear_scrollback().
+        self._hidden_log_count = 0
 
         # LogPane prompt_toolkit container render size.
         self._window_height = 20
@@ -132,6 +142,7 @@ class LogView:
         self._user_scroll_event: bool = False
 
         self._last_log_store_index = 0
+        self._last_log_store_evicted_count = self.log_store.evicted_log_count
         self._new_logs_since_last_render = True
         self._new_logs_since_last_websocket_serve = True
         self._last_served_websocket_index = -1
@@ -380,7 +391,7 @@ class LogView:
         # Reset filtered logs.
         self.filtered_logs.clear()
         # Reset scrollback start
-        self._scrollback_start_index = 0
+        self._hidden_log_count = 0
 
         # Start filtering existing log lines.
         self.filter_existing_logs_task = asyncio.create_task(
@@ -422,15 +433,15 @@ class LogView:
         self.search_highlight = False
         self._reset_log_screen_on_next_render = True
 
-    def _get_log_lines(self) -> Tuple[int, collections.deque[LogLine]]:
-        logs = self.log_store.logs
+    def _get_log_lines(self) -> Tuple[int, Sequence[LogLine]]:
+        logs: Sequence[LogLine] = self.log_store.logs
         if self.filtering_on:
             logs = self.filtered_logs
         return self._scrollback_start_index, logs
 
     def _get_visible_log_lines(self):
         _, logs = self._get_log_lines()
-        if self._scrollback_start_index > 0:
+        if self._hidden_log_count > 0:
             return collections.deque(
                 itertools.islice(logs, self.hidden_line_count(), len(logs)))
         return logs
@@ -441,6 +452,11 @@ class LogView:
             table_formatter = self.log_store.table.formatted_row
         return table_formatter
 
+    def _get_formatter_layout_key(self) -> Optional[tuple]:
+        if self.log_pane.table_view:
+            return self.log_store.table.layout_key()
+        return None
+
     def delete_filter(self, filter_text):
         if filter_text not in self.filters:
             return
@@ -464,7 +480,7 @@ class LogView:
             collections.OrderedDict())
         self.filtered_logs.clear()
         # Reset scrollback start
-        self._scrollback_start_index = 0
+        self._hidden_log_count = 0
         if not self.follow:
             self.toggle_follow()
 
@@ -530,18 +546,21 @@ class LogView:
         # Enable follow and scroll to the bottom, then clear.
         if not self.follow:
             self.toggle_follow()
-        self._scrollback_start_index = self.log_index
+        self._hidden_log_count = self.log_index + 1 if self.log_index else 0
         self._reset_log_screen_on_next_render = True
 
+    @property
+    def _scrollback_start_index(self) -> int:
+        """Index of the last hidden log or 0 if no logs are hidden."""
+        return max(0, self._hidden_log_count - 1)
+
     def hidden_line_count(self):
         """Return the number of hidden lines."""
-        if self._scrollback_start_index > 0:
-            return self._scrollback_start_index + 1
-        return 0
+        return self._hidden_log_count
 
     def undo_clear_scrollback(self):
         """Reset the current scrollback start index."""
-        self._scrollback_start_index = 0
+        self._hidden_log_count = 0
 
     def wrap_lines_enabled(self):
         """Get the parent log pane wrap lines setting."""
@@ -569,6 +588,52 @@ class LogView:
             return True
         return False
 
+    def _shift_log_indexes(self, evicted_count: int) -> None:
+        """Move saved log indexes down after logs are evicted from the store.
+
+        Indexes into filtered_logs are left as is since filtered logs are never
+        evicted."""
+        self._last_log_store_index = max(
+            0, self._last_log_store_index - evicted_count)
+        self._log_index = max(0, self._log_index - evicted_count)
+
+        if self.filtering_on:
+            return
+
+        # Keep the screen in place unless a log shown on it was evicted.
+        if not self.log_screen.shift_log_indexes(evicted_count):
+            self._reset_log_screen_on_next_render = True
+
+        self._last_log_index = max(-1, self._last_log_index - evicted_count)
+        self._last_served_websocket_index = max(
+            -1, self._last_served_websocket_index - evicted_count)
+        self._hidden_log_count = max(0,
+                                     self._hidden_log_count - evicted_count)
+
+        if (self.marked_logs_start is not None
+                and self.marked_logs_end is not None):
+            if self.marked_logs_end < evicted_count:
+                self.marked_logs_start = None
+                self.marked_logs_end = None
+                self.visual_select_mode = False
+            else:
+                self.marked_logs_start = max(
+                    0, self.marked_logs_start - evicted_count)
+                self.marked_logs_end -= evicted_count
+
+        if self.last_search_matched_log is not None:
+            self.last_search_matched_log -= evicted_count
+            if self.last_search_matched_log < 0:
+                self.last_search_matched_log = None
+
+        # Drop evicted matches and renumber the rest.
+        self.search_matched_lines = {
+            log_index - evicted_count: match_number
+            for match_number, log_index in enumerate(
+                log_index for log_index in self.search_matched_lines
+                if log_index >= evicted_count)
+        }
+
     def new_logs_arrived(self):
         """Check newly arrived log messages.
 
@@ -580,6 +645,15 @@ class LogView:
         """
         latest_total = self.log_store.get_total_count()
 
+        # Once the log store is full each new log evicts the oldest one and
+        # shifts all log indexes down.
+        evicted_count = (self.log_store.evicted_log_count -
+                         self._last_log_store_evicted_count)
+        self._last_log_store_evicted_count = (
+            self.log_store.evicted_log_count)
+        if evicted_count > 0:
+            self._shift_log_indexes(evicted_count)
+
         if self.filtering_on:
             # Scan newly arived log lines
             for i in range(self._last_log_store_index, latest_total):
@@ -838,8 +912,9 @@ class LogView:
             screen_update_needed = True
 
         if self._reset_log_screen_on_next_render or self.log_screen.empty():
-            # Clear the reset flag.
+            # Clear the reset flag. Any new logs are included in the reset.
             self._reset_log_screen_on_next_render = False
+            self._new_logs_since_last_render = False
             self.log_screen.reset_logs(log_index=self.log_index)
             screen_update_needed = True
 
@@ -864,9 +939,12 @@ class LogView:
             screen_update_needed = True
 
         if self.follow:
-            # Select the last line for follow mode.
+            # Select the last line for follow mode. New logs and resizes are
+            # handled above so only re-render if the cursor moved.
+            last_cursor_position = self.log_screen.cursor_position
             self.log_screen.move_cursor_to_bottom()
-            screen_update_needed = True
+            if self.log_screen.cursor_position != last_cursor_position:
+                screen_update_needed = True
 
         if self._user_scroll_event:
             self._user_scroll_event = False
@@ -14,6 +14,7 @@
 """Text formatting functions."""
 
 import copy
+import itertools
 import re
 from typing import Iterable, List, Tuple
 
@@ -26,9 +27,30 @@ _ANSI_SEQUENCE_REGEX = re.compile(r'\x1b[^m]*m')
 
 def strip_ansi(text: str):
     """Strip out ANSI escape sequences."""
+    # Most log text has no escape sequences; skip the regex engine entirely.
+    if '\x1b' not in text:
+        return text
     return _ANSI_SEQUENCE_REGEX.sub('', text)
 
 
+def ansi_stripped_length(text: str) -> int:
+    """Return the length of text excluding ANSI escape sequences.
+
+    Equivalent to len(strip_ansi(text)) without building a new string."""
+    length = 0
+    index = 0
+    while True:
+        escape_start = text.find('\x1b', index)
+        if escape_start == -1:
+            return length + len(text) - index
+        length += escape_start - index
+        escape_end = text.find('m', escape_start + 1)
+        if escape_end == -1:
+            # Unterminated escape sequences are counted as text.
+            return length + len(text) - escape_start
+        index = escape_end + 1
+
+
 def split_lines(
         input_fragments: StyleAndTextTuples) -> List[StyleAndTextTuples]:
     """Break a flattened list of StyleAndTextTuples into a list of lines.
@@ -177,8 +199,7 @@ def fill_character_width(input_fragments: StyleAndTextTuples,
         line_ends_in_a_break = True
 
     # Append remaining spaces
-    for _i in range(empty_characters):
-        line_fragments.append(single_space)
+    line_fragments.extend([single_space] * empty_characters)
 
     if line_ends_in_a_break:
         # Restore the \n
@@ -201,17 +222,12 @@ def flatten_formatted_text_tuples(
     This function will also remove trailing newlines to avoid displaying extra
     empty lines in prompt_toolkit containers.
     """
-    fragments: StyleAndTextTuples = []
+    fragments: StyleAndTextTuples = list(itertools.chain.from_iterable(lines))
 
     # Return empty list if lines is empty.
-    if not lines:
+    if not fragments:
         return fragments
 
-    for line_fragments in lines:
-        # Append all FormattedText tuples for this line.
-        for fragment in line_fragments:
-            fragments.append(fragment)
-
     # Strip off any trailing line breaks
     last_fragment: OneStyleAndTextTuple = fragments[-1]
     style = last_fragment[0]
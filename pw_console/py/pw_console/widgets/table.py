@@ -94,6 +94,17 @@ class TableView:
 
         return ordered_columns.items()
 
+    def layout_key(self) -> tuple:
+        """Return a key that changes whenever formatted_row output would.
+
+        Rows only change if column widths, order or visibility change or the
+        date and padding preferences are modified."""
+        return (
+            tuple(self._ordered_column_widths()),
+            self.prefs.hide_date_from_log_time,
+            self.column_padding,
+        )
+
     def update_metadata_column_widths(self, log: LogLine) -> None:
         """Calculate the max widths for each metadata field."""
         if log.metadata is None:
@@ -116,10 +127,10 @@ class TableView:
                 self.column_widths[field_name] = len(value_string)
 
         # Update log level character width.
-        ansi_stripped_level = pw_console.text_formatting.strip_ansi(
+        level_width = pw_console.text_formatting.ansi_stripped_length(
             log.record.levelname)
-        if len(ansi_stripped_level) > self.column_widths['level']:
-            self.column_widths['level'] = len(ansi_stripped_level)
+        if level_width > self.column_widths['level']:
+            self.column_widths['level'] = level_width
 
         self.column_width_prefix_total = self._width_of_justified_fields()
         self._update_table_header()
@@ -217,8 +228,7 @@ class TableView:
 
         # Grab the message to appear after the justified columns with ANSI
         # escape sequences removed.
-        message_text = pw_console.text_formatting.strip_ansi(
-            log.record.message)
+        message_text = log.ansi_stripped_message()
         message = log.metadata.fields.get(
             'msg',
             message_text.rstrip(),  # Remove any trailing line breaks
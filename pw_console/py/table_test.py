@@ -16,11 +16,13 @@
 from datetime import datetime
 import logging
 import unittest
+from unittest.mock import patch
 
 from parameterized import parameterized  # type: ignore
 
 from pw_console.console_prefs import ConsolePrefs
 from pw_console.log_line import LogLine
+from pw_console.text_formatting import strip_ansi
 from pw_console.widgets.table import TableView
 
 _TIMESTAMP_FORMAT = '%Y%m%d %H:%M:%S'
@@ -241,6 +243,34 @@ class TestTableView(unittest.TestCase):
             table.update_metadata_column_widths(log)
             self.assertEqual(formatted_log, table.formatted_row(log))
 
+    def test_formatted_row_strips_ansi_message(self) -> None:
+        """Test ANSI sequences are removed from the message column once."""
+        table = TableView(self.prefs)
+        log = make_log(
+            args=('MODULE2', 567.5, '\x1b[31mAnother\x1b[0m cool event'),
+            extra_metadata_fields=dict(module='MODULE2'))
+        table.update_metadata_column_widths(log)
+        expected_row = [
+            ('class:log-time', _TIMESTAMP_SAMPLE_STRING),
+            _TABLE_PADDING_FRAGMENT,
+            ('class:log-level-20', 'INF'),
+            _TABLE_PADDING_FRAGMENT,
+            ('class:log-table-column-0', 'MODULE2'),
+            _TABLE_PADDING_FRAGMENT,
+            ('', '[MODULE2] 567.500 Another cool event'),
+            ('', '\n')
+        ]
+
+        with patch('pw_console.log_line.strip_ansi',
+                   wraps=strip_ansi) as mock_strip_ansi:
+            self.assertEqual(expected_row, table.formatted_row(log))
+            self.assertEqual(expected_row, table.formatted_row(log))
+            self.assertEqual('[MODULE2] 567.500 Another cool event',
+                             log.ansi_stripped_message())
+        # The stripped message is cached on the LogLine.
+        mock_strip_ansi.assert_called_once_with(
+            '[MODULE2] 567.500 \x1b[31mAnother\x1b[0m cool event')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -19,9 +19,11 @@ from parameterized import parameterized  # type: ignore
 from prompt_toolkit.formatted_text import ANSI
 
 from pw_console.text_formatting import (
+    ansi_stripped_length,
     get_line_height,
     insert_linebreaks,
     split_lines,
+    strip_ansi,
 )
 
 
@@ -260,6 +262,19 @@ class TestTextFormatting(unittest.TestCase):
 
         self.assertEqual(result_lines, expected_lines)
 
+    @parameterized.expand([
+        ('empty', '', 0),
+        ('no escapes', 'Hello world', 11),
+        ('colored', '\x1b[31mHello\x1b[0m world', 11),
+        ('adjacent escapes', '\x1b[1m\x1b[31mHi\x1b[0m', 2),
+        ('only escapes', '\x1b[30;47m\x1b[0m', 0),
+        ('unterminated escape', 'Hi \x1b[31', 7),
+    ]) # yapf: disable
+    def test_ansi_stripped_length(self, _name, text, expected_length) -> None:
+        """Test ansi_stripped_length matches len(strip_ansi())."""
+        self.assertEqual(expected_length, ansi_stripped_length(text))
+        self.assertEqual(len(strip_ansi(text)), ansi_stripped_length(text))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# Copyright 2022 The Pigweed Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""Tests for snapshot processing."""
+
+import io
+import unittest
+from pw_snapshot import processor
+from pw_snapshot_protos import snapshot_pb2
+
+
+class ProcessSnapshotsTest(unittest.TestCase):
+    """Tests processing of snapshots with embedded related snapshots."""
+    def setUp(self):
+        super().setUp()
+        snapshot = snapshot_pb2.Snapshot()
+        snapshot.metadata.reason = b'Root snapshot'
+        child = snapshot.related_snapshots.add()
+        child.metadata.reason = b'Child snapshot'
+        grandchild = child.related_snapshots.add()
+        grandchild.metadata.reason = b'Grandchild snapshot'
+
+        self.snapshot = snapshot
+        self.serialized_snapshot = snapshot.SerializeToString()
+
+    def test_process_snapshots_includes_nested_snapshots(self):
+        output = processor.process_snapshots(self.serialized_snapshot)
+        root_position = output.index('Root snapshot')
+        child_position = output.index('Child snapshot')
+        grandchild_position = output.index('Grandchild snapshot')
+        self.assertLess(root_position, child_position)
+        self.assertLess(child_position, grandchild_position)
+
+    def test_process_snapshots_parsed_matches_serialized(self):
+        self.assertEqual(
+            processor.process_snapshots(self.serialized_snapshot),
+            processor.process_snapshots(self.snapshot))
+
+    def test_process_snapshot_parsed_matches_serialized(self):
+        self.assertEqual(
+            processor.process_snapshot(self.serialized_snapshot),
+            processor.process_snapshot(self.snapshot))
+
+    def test_user_processing_callback_gets_each_snapshot(self):
+        processed = []
+
+        def user_processing_callback(serialized_snapshot: bytes) -> str:
+            processed.append(serialized_snapshot)
+            return ''
+
+        processor.process_snapshots(
+            self.serialized_snapshot,
+            user_processing_callback=user_processing_callback)
+
+        child = self.snapshot.related_snapshots[0]
+        self.assertEqual([
+            self.serialized_snapshot,
+            child.SerializeToString(),
+            child.related_snapshots[0].SerializeToString(),
+        ], processed)
+
+    def test_streamed_output_matches_process_snapshots(self):
+        out_file = io.StringIO()
+        processor._load_and_dump_snapshots(  # pylint: disable=protected-access
+            in_file=io.BytesIO(self.serialized_snapshot),
+            out_file=out_file,
+            token_db=None,
+            artifacts_dir=None)
+        self.assertEqual(processor.process_snapshots(self.serialized_snapshot),
+                         out_file.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,7 +18,8 @@ import functools
 import logging
 import sys
 from pathlib import Path
-from typing import Optional, BinaryIO, TextIO, Callable
+from typing import (Optional, BinaryIO, TextIO, Callable, Iterator, Tuple,
+                    Union)
 import pw_tokenizer
 import pw_cpu_exception_cortex_m
 import pw_build_info.build_id
@@ -54,13 +55,36 @@ ElfMatcher = Callable[[snapshot_pb2.Snapshot], Optional[Path]]
 SymbolizerMatcher = Callable[[snapshot_pb2.Snapshot], Symbolizer]
 
 
+def _parse_snapshot(
+    snapshot: Union[bytes, snapshot_pb2.Snapshot]
+) -> Tuple[snapshot_pb2.Snapshot, bytes]:
+    """Returns both the parsed and serialized forms of a snapshot."""
+    if isinstance(snapshot, snapshot_pb2.Snapshot):
+        return snapshot, snapshot.SerializeToString()
+    return snapshot_pb2.Snapshot.FromString(snapshot), snapshot
+
+
 def process_snapshot(
-        serialized_snapshot: bytes,
+        serialized_snapshot: Union[bytes, snapshot_pb2.Snapshot],
         detokenizer: Optional[pw_tokenizer.Detokenizer] = None,
         elf_matcher: Optional[ElfMatcher] = None,
         symbolizer_matcher: Optional[SymbolizerMatcher] = None) -> str:
-    """Processes a single snapshot."""
+    """Processes a single snapshot.
 
+    The snapshot may be passed either serialized or as an already parsed
+    Snapshot proto to avoid parsing it again.
+    """
+    snapshot, serialized_snapshot = _parse_snapshot(serialized_snapshot)
+    return _process_snapshot(snapshot, serialized_snapshot, detokenizer,
+                             elf_matcher, symbolizer_matcher)
+
+
+def _process_snapshot(
+        snapshot: snapshot_pb2.Snapshot,
+        serialized_snapshot: bytes,
+        detokenizer: Optional[pw_tokenizer.Detokenizer] = None,
+        elf_matcher: Optional[ElfMatcher] = None,
+        symbolizer_matcher: Optional[SymbolizerMatcher] = None) -> str:
     output = [_BRANDING]
 
     captured_metadata = metadata.process_snapshot(serialized_snapshot,
@@ -69,9 +93,6 @@ def process_snapshot(
         output.append(captured_metadata)
 
     # Open a symbolizer.
-    snapshot = snapshot_pb2.Snapshot()
-    snapshot.ParseFromString(serialized_snapshot)
-
     if symbolizer_matcher is not None:
         symbolizer = symbolizer_matcher(snapshot)
     elif elf_matcher is not None:
@@ -108,36 +129,53 @@ def process_snapshot(
 
 
 def process_snapshots(
-        serialized_snapshot: bytes,
+        serialized_snapshot: Union[bytes, snapshot_pb2.Snapshot],
         detokenizer: Optional[pw_tokenizer.Detokenizer] = None,
         elf_matcher: Optional[ElfMatcher] = None,
         user_processing_callback: Optional[Callable[[bytes], str]] = None,
         symbolizer_matcher: Optional[SymbolizerMatcher] = None) -> str:
-    """Processes a snapshot that may have multiple embedded snapshots."""
-    output = []
+    """Processes a snapshot that may have multiple embedded snapshots.
+
+    The snapshot may be passed either serialized or as an already parsed
+    Snapshot proto to avoid parsing it again.
+    """
+    return ''.join(
+        _iter_processed_snapshots(serialized_snapshot, detokenizer,
+                                  elf_matcher, user_processing_callback,
+                                  symbolizer_matcher))
+
+
+def _iter_processed_snapshots(
+        serialized_snapshot: Union[bytes, snapshot_pb2.Snapshot],
+        detokenizer: Optional[pw_tokenizer.Detokenizer] = None,
+        elf_matcher: Optional[ElfMatcher] = None,
+        user_processing_callback: Optional[Callable[[bytes], str]] = None,
+        symbolizer_matcher: Optional[SymbolizerMatcher] = None
+) -> Iterator[str]:
+    """Yields the processed output of a snapshot tree one section at a time.
+
+    Sections include their separators so concatenating them gives the full
+    output. The already parsed related snapshots are passed down directly so
+    nested snapshots are never parsed twice.
+    """
+    snapshot, serialized_snapshot = _parse_snapshot(serialized_snapshot)
+
     # Process the top-level snapshot.
-    output.append(
-        process_snapshot(serialized_snapshot, detokenizer, elf_matcher,
-                         symbolizer_matcher))
+    yield _process_snapshot(snapshot, serialized_snapshot, detokenizer,
+                            elf_matcher, symbolizer_matcher)
 
     # If the user provided a custom processing callback, call it on each
     # snapshot.
     if user_processing_callback is not None:
-        output.append(user_processing_callback(serialized_snapshot))
+        yield '\n' + user_processing_callback(serialized_snapshot)
 
     # Process any related snapshots that were embedded in this one.
-    snapshot = snapshot_pb2.Snapshot()
-    snapshot.ParseFromString(serialized_snapshot)
     for nested_snapshot in snapshot.related_snapshots:
-        output.append('\n[' + '=' * 78 + ']\n')
-        output.append(
-            str(
-                process_snapshots(nested_snapshot.SerializeToString(),
-                                  detokenizer, elf_matcher,
-                                  user_processing_callback,
-                                  symbolizer_matcher)))
-
-    return '\n'.join(output)
+        yield '\n\n[' + '=' * 78 + ']\n\n'
+        yield from _iter_processed_snapshots(nested_snapshot, detokenizer,
+                                             elf_matcher,
+                                             user_processing_callback,
+                                             symbolizer_matcher)
 
 
 def _snapshot_symbolizer_matcher(
@@ -161,10 +199,12 @@ def _load_and_dump_snapshots(in_file: BinaryIO, out_file: TextIO,
     if artifacts_dir:
         symbolizer_matcher = functools.partial(_snapshot_symbolizer_matcher,
                                                artifacts_dir)
-    out_file.write(
-        process_snapshots(serialized_snapshot=in_file.read(),
-                          detokenizer=detokenizer,
-                          symbolizer_matcher=symbolizer_matcher))
+    # Write each section as it is processed rather than holding the output of
+    # every nested snapshot in memory.
+    out_file.writelines(
+        _iter_processed_snapshots(serialized_snapshot=in_file.read(),
+                                  detokenizer=detokenizer,
+                                  symbolizer_matcher=symbolizer_matcher))
 
 
 def _parse_args():
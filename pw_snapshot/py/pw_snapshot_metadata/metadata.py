@@ -37,8 +37,8 @@ def _process_tags(tags: Mapping[str, str]) -> Optional[str]:
 def process_snapshot(serialized_snapshot: bytes,
                      tokenizer_db: Optional[pw_tokenizer.Detokenizer]) -> str:
     """Processes snapshot metadata and tags, producing a multi-line string."""
-    snapshot = snapshot_metadata_pb2.SnapshotBasicInfo()
-    snapshot.ParseFromString(serialized_snapshot)
+    snapshot = snapshot_metadata_pb2.SnapshotBasicInfo.FromString(
+        serialized_snapshot)
 
     output: List[str] = []
 
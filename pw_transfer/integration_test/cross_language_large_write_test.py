@@ -31,7 +31,6 @@ Which tests to run can be specified as command-line arguments:
 """
 
 from parameterized import parameterized
-import random
 
 from google.protobuf import text_format
 
@@ -79,7 +78,8 @@ class LargeWriteTransferIntegrationTest(TransferIntegrationTest):
                 { data_dropper: {rate: 0.01, seed: 1649963713563718436} }
         ]""", config_pb2.ProxyConfig())
 
-        payload = random.Random(1649963713563718437).randbytes(1 * 1024 * 1024)
+        payload = test_fixture.random_payload(1649963713563718437,
+                                              1 * 1024 * 1024)
         resource_id = 12
         config = TransferConfig(server_config, client_config, proxy_config)
         self.do_single_write(client_type, config, resource_id, payload)
@@ -116,7 +116,8 @@ class LargeWriteTransferIntegrationTest(TransferIntegrationTest):
                 { data_transposer: {rate: 0.005, timeout: 0.5, seed: 1649963713563718435} }
         ]""", config_pb2.ProxyConfig())
 
-        payload = random.Random(1649963713563718437).randbytes(1 * 1024 * 1024)
+        payload = test_fixture.random_payload(1649963713563718437,
+                                              1 * 1024 * 1024)
         resource_id = 12
         config = TransferConfig(server_config, client_config, proxy_config)
         self.do_single_write(client_type, config, resource_id, payload)
@@ -32,9 +32,6 @@ Which tests to run can be specified as command-line arguments:
 
 import itertools
 from parameterized import parameterized
-import random
-
-from google.protobuf import text_format
 
 from pigweed.pw_transfer.integration_test import config_pb2
 import test_fixture
@@ -52,7 +49,7 @@ class MediumTransferWriteIntegrationTest(test_fixture.TransferIntegrationTest):
                           (config_pb2.TransferAction.ProtocolVersion.V1,
                            config_pb2.TransferAction.ProtocolVersion.V2)))
     def test_medium_client_write(self, client_type, protocol_version):
-        payload = random.Random(67336391945).randbytes(512)
+        payload = test_fixture.random_payload(67336391945, 512)
         config = self.default_config()
         resource_id = 5
         self.do_single_write(client_type, config, resource_id, payload,
@@ -69,7 +66,7 @@ class MediumTransferWriteIntegrationTest(test_fixture.TransferIntegrationTest):
         # buffer space. ~10KB is relatively arbitrary, but is to ensure that
         # more than a small handful of packets are sent between the server
         # and client.
-        payload = b"~" * 98731
+        payload = test_fixture.HDLC_ESCAPE_PAYLOAD
         config = self.default_config()
         resource_id = 5
         self.do_single_write(client_type, config, resource_id, payload,
@@ -81,20 +78,10 @@ class MediumTransferWriteIntegrationTest(test_fixture.TransferIntegrationTest):
                            config_pb2.TransferAction.ProtocolVersion.V2)))
     def test_pattern_drop_client_write(self, client_type, protocol_version):
         """Drops packets with an alternating pattern."""
-        payload = random.Random(67336391945).randbytes(1234)
+        payload = test_fixture.random_payload(67336391945, 1234)
         config = TransferConfig(
             self.default_server_config(), self.default_client_config(),
-            text_format.Parse(
-                """
-                client_filter_stack: [
-                    { hdlc_packetizer: {} },
-                    { keep_drop_queue: {keep_drop_queue: [5, 1]} }
-                ]
-
-                server_filter_stack: [
-                    { hdlc_packetizer: {} },
-                    { keep_drop_queue: {keep_drop_queue: [5, 1]} }
-            ]""", config_pb2.ProxyConfig()))
+            test_fixture.PATTERN_DROP_PROXY_CONFIG)
         # Resource ID is arbitrary, but deliberately set to be >1 byte.
         resource_id = 1337
 
@@ -114,20 +101,10 @@ class MediumTransferWriteIntegrationTest(test_fixture.TransferIntegrationTest):
                            config_pb2.TransferAction.ProtocolVersion.V2)))
     def test_parameter_drop_client_write(self, client_type, protocol_version):
         """Drops the first few transfer initialization packets."""
-        payload = random.Random(67336391945).randbytes(1234)
+        payload = test_fixture.random_payload(67336391945, 1234)
         config = TransferConfig(
             self.default_server_config(), self.default_client_config(),
-            text_format.Parse(
-                """
-                client_filter_stack: [
-                    { hdlc_packetizer: {} },
-                    { keep_drop_queue: {keep_drop_queue: [2, 1, -1]} }
-                ]
-
-                server_filter_stack: [
-                    { hdlc_packetizer: {} },
-                    { keep_drop_queue: {keep_drop_queue: [1, 2, -1]} }
-            ]""", config_pb2.ProxyConfig()))
+            test_fixture.PARAMETER_DROP_PROXY_CONFIG)
         # Resource ID is arbitrary, but deliberately set to be >2 bytes.
         resource_id = 597419
         self.do_single_write(client_type, config, resource_id, payload,
@@ -17,9 +17,11 @@
 import argparse
 import asyncio
 from dataclasses import dataclass
+import functools
 import logging
 import pathlib
 from pathlib import Path
+import random
 import sys
 import tempfile
 from typing import BinaryIO, Iterable, List, NamedTuple, Optional
@@ -35,6 +37,44 @@ _LOG = logging.getLogger('pw_transfer_intergration_test_proxy')
 _LOG.level = logging.DEBUG
 _LOG.addHandler(logging.StreamHandler(sys.stdout))
 
+# Payload made entirely of bytes that HDLC escapes.
+HDLC_ESCAPE_PAYLOAD = b"~" * 98731
+
+# Proxy configs are only read by the test harness, so each is parsed once and
+# shared by every test that uses it.
+PATTERN_DROP_PROXY_CONFIG = text_format.Parse(
+    """
+    client_filter_stack: [
+        { hdlc_packetizer: {} },
+        { keep_drop_queue: {keep_drop_queue: [5, 1]} }
+    ]
+
+    server_filter_stack: [
+        { hdlc_packetizer: {} },
+        { keep_drop_queue: {keep_drop_queue: [5, 1]} }
+    ]""", config_pb2.ProxyConfig())
+
+PARAMETER_DROP_PROXY_CONFIG = text_format.Parse(
+    """
+    client_filter_stack: [
+        { hdlc_packetizer: {} },
+        { keep_drop_queue: {keep_drop_queue: [2, 1, -1]} }
+    ]
+
+    server_filter_stack: [
+        { hdlc_packetizer: {} },
+        { keep_drop_queue: {keep_drop_queue: [1, 2, -1]} }
+    ]""", config_pb2.ProxyConfig())
+
+
+@functools.lru_cache(maxsize=None)
+def random_payload(seed: int, size: int) -> bytes:
+    """Returns deterministic random bytes.
+
+    Payloads are cached so tests using the same seed and size share one copy.
+    """
+    return random.Random(seed).randbytes(size)
+
 
 class LogMonitor():
     """Monitors lines read from the reader, and logs them."""
@@ -203,7 +203,9 @@ class WatchApp(PluginMixin):
         self._errors_in_output = False
 
         self.log_ui_update_frequency = 0.1  # 10 FPS
-        self._last_ui_update_time = time.time()
+        # Monotonic clock time of the last redraw. Unaffected by system clock
+        # changes.
+        self._last_ui_update_time = time.monotonic()
 
         self.ninja_log_pane = LogPane(application=self,
                                       pane_title='Pigweed Watch')
@@ -352,7 +354,7 @@ class WatchApp(PluginMixin):
         )
 
     def logs_redraw(self):
-        emit_time = time.time()
+        emit_time = time.monotonic()
         # Has enough time passed since last UI redraw due to new logs?
         if emit_time > self._last_ui_update_time + self.log_ui_update_frequency:
             # Update last log time